@@ -6,11 +6,19 @@ from __future__ import annotations
 
 import json
 import logging
+import operator
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
+# Optional Rust-based JSON encoder; the stdlib json module is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER_NAME: str = "pylogcfg"
 
 config_file: Path = Path(__file__).resolve().parent.parent.parent / "pylogconfig.json"
@@ -40,6 +48,31 @@ LOG_RECORD_KEYS: list[str] = [
     "taskname",
 ]
 
+# Frozen view of LOG_RECORD_KEYS for O(1) membership checks on the hot path
+LOG_RECORD_KEYS_SET: frozenset[str] = frozenset(LOG_RECORD_KEYS)
+
+# Attributes every LogRecord carries from construction
+_BASE_RECORD_ATTRS: frozenset[str] = frozenset(
+    vars(logging.LogRecord("x", 0, "", 0, "", (), None))
+)
+
+# Anything beyond these was injected by the caller (via `extra=...`) and
+# counts as an extra field. message/asctime are added by Formatter /
+# QueueHandler preparation, so records arriving through the queue must
+# not treat them as extras.
+_DEFAULT_RECORD_ATTRS: frozenset[str] = _BASE_RECORD_ATTRS | {"message", "asctime"}
+
+
+@lru_cache(maxsize=32)
+def _get_tz(name: str) -> ZoneInfo:
+    """
+    Builds a ZoneInfo instance, cached module-wide.
+
+    ZoneInfo construction reads and parses a tzdata file from disk, so
+    repeated formatter instantiation reuses the same object instead.
+    """
+    return ZoneInfo(name)
+
 
 def create_default_config() -> None:
     """
@@ -51,12 +84,15 @@ def create_default_config() -> None:
         "app": "my_system",
         "logs_dir": str(logs_dir),
         "console_format": logging.BASIC_FORMAT,
+        "console_enabled": True,
         "date_format": "%Y-%m-%dT%H:%M:%S%z",
         "include_extras": False,
         "level": "DEBUG",
         "logger_name": "mylogger",
         "backup_count": 5,
         "max_log_size": 5_242_880,
+        "queue_maxsize": 10000,
+        "queue_full_policy": "drop",
         "timezone": "America/Sao_Paulo",
         "included_keys": {k: True for k in LOG_RECORD_KEYS},
     }
@@ -67,22 +103,43 @@ def create_default_config() -> None:
     print(f"INFO:pylogcfg:Default configuration file created at {config_file}")
 
 
+# Parsed configuration cache, keyed by (path, mtime) — see load_configs
+_config_cache: Optional[tuple[str, float, dict[str, Any]]] = None
+
+
 def load_configs() -> dict[str, Any]:
     """
     Loads logging configuration from the JSON file.
 
-    If the file does not exist, it creates a default one first.
+    If the file does not exist, it creates a default one first. The
+    parsed dictionary is cached and reused until the file's mtime
+    changes, so repeated get_logger calls cost a single stat instead of
+    a full read and parse.
 
     Returns
     -------
     dict[str, Any]
         Dictionary with all configuration parameters.
     """
+    global _config_cache
+
     if not config_file.exists():
         create_default_config()
 
+    path = str(config_file)
+    mtime = config_file.stat().st_mtime
+    if (
+        _config_cache is not None
+        and _config_cache[0] == path
+        and _config_cache[1] == mtime
+    ):
+        return _config_cache[2]
+
     with config_file.open(encoding="utf-8") as f:
-        return json.load(f)
+        config: dict[str, Any] = json.load(f)
+
+    _config_cache = (path, mtime, config)
+    return config
 
 
 def setup() -> dict[str, Any]:
@@ -119,17 +176,90 @@ class JSONLogFormatter(logging.Formatter):
         super().__init__(datefmt=self.cfg.get("date_format"))
 
         active_keys: dict[str, bool] = self.cfg.get("included_keys", {})
-        self.include_keys: list[str] = [
-            key for key, active in active_keys.items() if active
-        ]
+        self.include_keys: tuple[str, ...] = tuple(
+            key
+            for key, active in active_keys.items()
+            if active and key in LOG_RECORD_KEYS_SET
+        )
         self.datefmt: str | None = self.cfg.get("date_format")
 
+        # Fields that never change between records, pre-encoded once: the
+        # opening brace plus the app/environment pairs. format_bytes
+        # splices the dynamic body after this prefix instead of paying to
+        # re-encode the same keys and values on every record.
+        self._static: dict[str, Any] = {
+            "app": self.cfg.get("app"),
+            "environment": self.cfg.get("environment"),
+        }
+        if orjson is not None:
+            self._prefix: bytes = orjson.dumps(self._static)[:-1]
+        else:
+            self._prefix = json.dumps(self._static, ensure_ascii=False)[:-1].encode(
+                "utf-8"
+            )
+
+        # Builder specialized to the configured schema (see _compile_builder)
+        self._build_data = self._compile_builder()
+
+        # ISO default can use datetime.isoformat (C code) instead of strftime;
+        # the single-slot cache reuses the string for records in the same second.
+        self._use_isoformat: bool = (
+            self.datefmt is None or self.datefmt == "%Y-%m-%dT%H:%M:%S%z"
+        )
+        self._ts_cache: tuple[int, Optional[str], str] = (-1, None, "")
+
         try:
-            self.tz: ZoneInfo = ZoneInfo(self.cfg.get("timezone", "America/Sao_Paulo"))
+            self.tz: ZoneInfo = _get_tz(self.cfg.get("timezone", "America/Sao_Paulo"))
         except Exception:
             print("WARNING:pylogcfg:Invalid timezone. Using local timezone.")
             self.tz = datetime.now().astimezone().tzinfo or timezone.utc
 
+    def _compile_builder(self):
+        """
+        Generate a record-dict builder specialized to the configured schema.
+
+        The include_keys selection is fixed at init time, so the
+        per-record dict can come from a generated function whose dict
+        literal has every key inlined — no loop, no template copy and no
+        per-key branches at format time. Static fields are not part of
+        the dict; they live in the pre-encoded _prefix. Keys guaranteed to exist on every
+        LogRecord are pulled in bulk with a single operator.attrgetter
+        call; the remainder (asctime and friends, only present after a
+        Formatter has touched the record) fall back to a dict lookup.
+
+        Returns
+        -------
+        Callable[[logging.LogRecord, Callable[[str], Any]], dict[str, Any]]
+            Function taking the record and record.__dict__.get and
+            returning the dict.
+        """
+        present = tuple(k for k in self.include_keys if k in _BASE_RECORD_ATTRS)
+        absent = tuple(k for k in self.include_keys if k not in _BASE_RECORD_ATTRS)
+
+        items: list[str] = []
+        body = ""
+        if len(present) == 1:
+            body = "    v0 = _getter(record)\n"
+            items.append(f"{present[0]!r}: v0")
+        elif present:
+            names = ", ".join(f"v{i}" for i in range(len(present)))
+            body = f"    {names} = _getter(record)\n"
+            items += [f"{key!r}: v{i}" for i, key in enumerate(present)]
+        items += [f"{key!r}: get({key!r})" for key in absent]
+
+        source = (
+            "def _build(record, get):\n"
+            + body
+            + "    return {"
+            + ", ".join(items)
+            + "}"
+        )
+        namespace: dict[str, Any] = {
+            "_getter": operator.attrgetter(*present) if present else None
+        }
+        exec(source, namespace)
+        return namespace["_build"]
+
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         """
         Format a LogRecord into a structured JSON string.
@@ -144,17 +274,36 @@ class JSONLogFormatter(logging.Formatter):
         str
             The JSON-formatted log string.
         """
-        data: dict[str, Any] = {}
+        return self.format_bytes(record).decode("utf-8")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """
+        Format a LogRecord into UTF-8 encoded JSON bytes.
+
+        Handlers that write to a binary stream or raw file descriptor can
+        consume this directly, skipping the bytes -> str -> bytes round trip.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The log record to format.
 
-        for key in self.include_keys:
-            if key in LOG_RECORD_KEYS:
-                value = getattr(record, key, None)
-                data[key] = value
+        Returns
+        -------
+        bytes
+            The JSON-formatted log line as UTF-8 bytes (no trailing newline).
+        """
+        data: dict[str, Any] = self._build_data(record, record.__dict__.get)
 
-        data["app"] = self.cfg.get("app")
-        data["environment"] = self.cfg.get("environment")
         data["created"] = self.formatTime(record, self.datefmt)
-        data["message"] = record.getMessage()
+
+        # Inline getMessage: skip the % merge entirely when there are no
+        # args (the common case with f-string call sites)
+        if record.args:
+            data["message"] = record.msg % record.args
+        else:
+            msg = record.msg
+            data["message"] = msg if isinstance(msg, str) else str(msg)
 
         if record.exc_info:
             exc_text = self.formatException(record.exc_info)
@@ -164,13 +313,24 @@ class JSONLogFormatter(logging.Formatter):
         if record.stack_info:
             data["stack_info"] = self.formatStack(record.stack_info)
 
-        # Include additional fields
+        # Include additional fields (skipped entirely when the record has none)
         if self.cfg.get("include_extras", True):
-            for key, value in vars(record).items():
-                if key not in LOG_RECORD_KEYS:
-                    data[key] = value
-
-        return json.dumps(data, default=str, ensure_ascii=False)
+            extras = record.__dict__.keys() - _DEFAULT_RECORD_ATTRS
+            for key in extras:
+                data[key] = record.__dict__[key]
+
+        if orjson is not None:
+            body = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+            )
+        else:
+            body = json.dumps(data, default=str, ensure_ascii=False).encode("utf-8")
+
+        if len(body) <= 2:  # b"{}": no dynamic fields at all
+            return self._prefix + b"}"
+        return self._prefix + b"," + body[1:]
 
     def formatTime(  # type: ignore[override]
         self, record: logging.LogRecord, datefmt: Optional[str] = None
@@ -190,6 +350,25 @@ class JSONLogFormatter(logging.Formatter):
         str
             Formatted timestamp string.
         """
-        return datetime.fromtimestamp(record.created, tz=self.tz).strftime(
-            datefmt or self.datefmt or "%Y-%m-%dT%H:%M:%S%z"
-        )
+        if self._use_isoformat and (datefmt is None or datefmt == self.datefmt):
+            fmt: Optional[str] = None
+        else:
+            fmt = datefmt or self.datefmt or "%Y-%m-%dT%H:%M:%S%z"
+            if "%f" in fmt:
+                # Sub-second formats cannot be cached at second granularity
+                return datetime.fromtimestamp(record.created, tz=self.tz).strftime(
+                    fmt
+                )
+
+        second = int(record.created)
+        cached_second, cached_fmt, cached_value = self._ts_cache
+        if second == cached_second and fmt == cached_fmt:
+            return cached_value
+
+        moment = datetime.fromtimestamp(second, tz=self.tz)
+        if fmt is None:
+            value = moment.isoformat(timespec="seconds")
+        else:
+            value = moment.strftime(fmt)
+        self._ts_cache = (second, fmt, value)
+        return value
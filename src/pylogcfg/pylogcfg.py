@@ -1,28 +1,355 @@
 """
 Main module for managing asynchronous loggers and logging queues.
+
+For hot paths, the module-level DEBUG_ENABLED flag allows call sites to
+skip argument evaluation entirely when DEBUG records would be discarded.
+Read it as a module attribute — `from pylogcfg.pylogcfg import
+DEBUG_ENABLED` would freeze the pre-initialization value (False) in the
+importing namespace, since initialize_logging only rebinds the global:
+
+    from pylogcfg import pylogcfg
+
+    pylogcfg.DEBUG_ENABLED and logger.debug("expensive %s", compute())
+
+The dbg() helper performs the equivalent check itself and is always
+safe to import directly.
 """
 
 from __future__ import annotations
 
 import atexit
 import logging
-import logging.config
 import logging.handlers
+import os
 import queue
+import sys
 import threading
-import time
 from pathlib import Path
 from typing import Any, Optional
 
 from .cfg_pylogcfg import _LOGGER_NAME, JSONLogFormatter, setup
 
+# Records discarded because the bounded queue was full (policy "drop")
+_dropped_records: int = 0
+
+# Snapshot of the configured level taken during initialize_logging;
+# False until the logging system is initialized. Read as an attribute
+# (pylogcfg.DEBUG_ENABLED) — importing the name directly would bind
+# this pre-init value permanently in the caller's namespace.
+DEBUG_ENABLED: bool = False
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler aware of a bounded queue.
+
+    When the queue is full, policy "drop" waits briefly for space and
+    then discards the record (counted in _dropped_records), keeping the
+    producer responsive; policy "block" waits until space is available.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue | queue.SimpleQueue, policy: str = "drop"
+    ) -> None:
+        super().__init__(log_queue)
+        self.policy = policy
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        global _dropped_records
+
+        if self.policy == "block":
+            self.queue.put(record, block=True)
+            return
+
+        try:
+            self.queue.put(record, block=True, timeout=0.1)
+        except queue.Full:
+            _dropped_records += 1
+
+
+class FastJSONLRotatingHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler variant that writes pre-encoded UTF-8 bytes
+    straight to a raw file descriptor.
+
+    Skips the TextIOWrapper + incremental-encoder stack that text-mode
+    handlers pay per record. The rotation threshold is tracked with a
+    byte counter instead of stream.tell().
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("delay", True)
+        super().__init__(*args, **kwargs)
+        self._fd: Optional[int] = None
+        self._pos: int = 0
+
+    def _open_fd(self) -> int:
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._pos = os.fstat(fd).st_size
+        return fd
+
+    def write_payload(self, payload: bytes) -> None:
+        """
+        Write pre-encoded bytes (one or more newline-terminated JSON
+        lines), rotating first if the payload would exceed maxBytes.
+
+        Parameters
+        ----------
+        payload : bytes
+            UTF-8 encoded log lines, each terminated by a newline.
+        """
+        self.acquire()
+        try:
+            if self._fd is None:
+                self._fd = self._open_fd()
+            if self.maxBytes > 0 and self._pos + len(payload) > self.maxBytes:
+                self.doRollover()
+            os.write(self._fd, payload)
+            self._pos += len(payload)
+        finally:
+            self.release()
+
+    def write_vectored(self, buffers: list[bytes]) -> None:
+        """
+        Write a batch of pre-encoded buffers with a single writev call.
+
+        os.writev submits the whole iovec in one syscall and releases
+        the GIL for the entire write, so producer threads keep running
+        while the batch hits the disk — no Python-level join/copy of the
+        buffers is needed.
+
+        Parameters
+        ----------
+        buffers : list[bytes]
+            UTF-8 encoded chunks forming complete, newline-terminated
+            log lines when concatenated.
+        """
+        total = sum(map(len, buffers))
+        self.acquire()
+        try:
+            if self._fd is None:
+                self._fd = self._open_fd()
+            if self.maxBytes > 0 and self._pos + total > self.maxBytes:
+                self.doRollover()
+            os.writev(self._fd, buffers)
+            self._pos += total
+        finally:
+            self.release()
+
+    def doRollover(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+            dfn = self.rotation_filename(self.baseFilename + ".1")
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            self.rotate(self.baseFilename, dfn)
+
+        self._fd = self._open_fd()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Direct (non-batched) emission of a single record.
+        """
+        try:
+            formatter = self.formatter
+            if hasattr(formatter, "format_bytes"):
+                payload = formatter.format_bytes(record) + b"\n"
+            else:
+                payload = (self.format(record) + "\n").encode("utf-8")
+            self.write_payload(payload)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+class BatchingListener(threading.Thread):
+    """
+    Consumer thread that drains the log queue in batches.
+
+    Unlike QueueListener, which formats and writes one record per queue
+    item, this thread pops up to BATCH_MAX records per iteration and
+    writes the whole formatted batch with a single stream write + flush,
+    amortizing the per-record I/O cost under bursty logging.
+    """
+
+    BATCH_MAX: int = 32
+
+    _sentinel = None
+
+    def __init__(
+        self,
+        log_queue: queue.Queue | queue.SimpleQueue,
+        handler: logging.handlers.RotatingFileHandler,
+    ) -> None:
+        super().__init__(name="pylogcfg-listener", daemon=True)
+        self.queue = log_queue
+        self.handler = handler
+        # Reused batch buffer: drained records fill slots up to BATCH_MAX,
+        # avoiding a fresh list allocation on every drain iteration
+        self._batch: list[Optional[logging.LogRecord]] = [None] * self.BATCH_MAX
+        self._batch_len: int = 0
+
+    def run(self) -> None:
+        while True:
+            stopping = self._drain()
+            if self._batch_len:
+                self._write_batch(self._batch_len)
+            if stopping:
+                break
+
+    def _drain(self) -> bool:
+        """
+        Block for one record, then opportunistically pop up to BATCH_MAX
+        without blocking, filling the reused batch buffer. Returns
+        whether the sentinel was seen.
+        """
+        batch = self._batch
+        self._batch_len = 0
+
+        item = self.queue.get()
+        if item is self._sentinel:
+            return True
+        batch[0] = item
+        count = 1
+
+        while count < self.BATCH_MAX:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._sentinel:
+                self._batch_len = count
+                return True
+            batch[count] = item
+            count += 1
+
+        self._batch_len = count
+        return False
+
+    def _write_batch(self, count: int) -> None:
+        """
+        Format the first `count` buffered records and write them as a
+        single payload, honoring the handler's rotation threshold once
+        per batch. Each record is formatted under its own guard, so a
+        poison record is routed to the handler's handleError and dropped
+        without discarding the rest of the batch. Buffer slots are
+        cleared afterwards so records (and any tracebacks they carry)
+        do not outlive the write.
+        """
+        batch = self._batch
+        formatter = self.handler.formatter
+        use_vectored = hasattr(self.handler, "write_vectored") and hasattr(
+            formatter, "format_bytes"
+        )
+
+        buffers: list[bytes] = []
+        lines: list[str] = []
+        for i in range(count):
+            record = batch[i]
+            try:
+                if use_vectored:
+                    buffers.append(formatter.format_bytes(record))
+                    buffers.append(b"\n")
+                else:
+                    lines.append(self.handler.format(record))
+            except Exception:
+                self.handler.handleError(record)
+
+        try:
+            if use_vectored:
+                if buffers:
+                    self.handler.write_vectored(buffers)
+            elif lines:
+                text = "\n".join(lines) + "\n"
+                self.handler.acquire()
+                try:
+                    if self.handler.stream is None:
+                        self.handler.stream = self.handler._open()
+                    if (
+                        self.handler.maxBytes > 0
+                        and self.handler.stream.tell() + len(text)
+                        >= self.handler.maxBytes
+                    ):
+                        self.handler.doRollover()
+                        # On delay=True handlers doRollover leaves the
+                        # stream closed; re-open before writing
+                        if self.handler.stream is None:
+                            self.handler.stream = self.handler._open()
+                    self.handler.stream.write(text)
+                    self.handler.stream.flush()
+                finally:
+                    self.handler.release()
+        except Exception:
+            self.handler.handleError(batch[0])
+        finally:
+            for i in range(count):
+                batch[i] = None
+            self._batch_len = 0
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Signal the thread to finish draining and wait for it to exit.
+        """
+        self.queue.put(self._sentinel)
+        self.join(timeout)
+
+
 # Global objects controlling the logging system state
-_listener: Optional[logging.handlers.QueueListener] = None
+_listener: Optional[BatchingListener] = None
 _logger: Optional[logging.Logger] = None
-_log_queue: Optional[queue.Queue] = None
+_log_queue: Optional[queue.Queue | queue.SimpleQueue] = None
 _init_lock = threading.Lock()
 
 
+def _install_fast_level_check(logger: logging.Logger) -> None:
+    """
+    Replace isEnabledFor on this logger instance with a plain integer
+    compare against its cached effective level.
+
+    Skips the manager-disable check, the per-logger cache dict and the
+    ancestor traversal that stock isEnabledFor performs on every call.
+    The compare is rebound whenever setLevel is called on the logger so
+    the cached level never goes stale.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        Logger whose level checks should be fast-pathed.
+    """
+
+    def _bind() -> None:
+        effective = logger.getEffectiveLevel()
+        logger.isEnabledFor = lambda level, _effective=effective: level >= _effective
+
+    original_set_level = logger.setLevel
+
+    def _set_level(level: str | int) -> None:
+        original_set_level(level)
+        _bind()
+
+    logger.setLevel = _set_level
+    _bind()
+
+
 def initialize_logging(json_config: dict[str, Any]) -> logging.Logger:
     """
     Initializes the logging system with queue support and asynchronous JSON writing.
@@ -37,68 +364,75 @@ def initialize_logging(json_config: dict[str, Any]) -> logging.Logger:
     logging.Logger
         The main system logger.
     """
-    global _logger, _log_queue, _listener
+    global _logger, _log_queue, _listener, DEBUG_ENABLED
 
     with _init_lock:
         if _logger is not None:
             return _logger
 
-        # Create queue for asynchronous log processing
-        _log_queue = queue.Queue()
+        # Bounded queue for asynchronous log processing; caps memory growth
+        # when the disk cannot keep up with producers. With no bound
+        # (queue_maxsize <= 0), SimpleQueue's C-implemented, lock-light
+        # put path avoids producer contention under concurrent logging.
+        maxsize = int(json_config.get("queue_maxsize", 10000))
+        _log_queue = queue.SimpleQueue() if maxsize <= 0 else queue.Queue(maxsize)
 
-        # FileHandler with rotation and JSON formatter
-        file_handler = logging.handlers.RotatingFileHandler(
+        # FileHandler with rotation, JSON formatter and raw binary writes
+        file_handler = FastJSONLRotatingHandler(
             filename=str(json_config.get("log_file")),
             maxBytes=int(json_config.get("max_log_size", 5_242_880)),
             backupCount=int(json_config.get("backup_count", 5)),
-            encoding="utf-8",
             delay=True,
         )
         file_handler.namer = lambda name: Path(name).with_suffix(".jsonl").as_posix()
         file_handler.setFormatter(JSONLogFormatter(json_config))
         file_handler.setLevel(logging.DEBUG)
 
-        # Listener that consumes the queue on a separate thread
-        _listener = logging.handlers.QueueListener(_log_queue, file_handler)
+        # Listener that consumes the queue in batches on a separate thread
+        _listener = BatchingListener(_log_queue, file_handler)
         _listener.start()
         atexit.register(_stop_listener)
 
-        # Base logging configuration (console + queue)
-        log_config: dict[str, Any] = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "console": {
-                    "format": json_config.get("console_format"),
-                    "datefmt": "[%X]",
-                }
-            },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "formatter": "console",
-                    "level": "DEBUG",
-                    "stream": "ext://sys.stdout",
-                },
-                "queue": {
-                    "class": "logging.handlers.QueueHandler",
-                    "queue": _log_queue,
-                    "level": "DEBUG",
-                },
-            },
-            "loggers": {
-                _LOGGER_NAME: {
-                    "handlers": ["console", "queue"],
-                    "level": "DEBUG",
-                    "propagate": False,
-                },
-            },
-            "root": {"handlers": ["console", "queue"], "level": "DEBUG"},
-        }
-
-        logging.config.dictConfig(log_config)
+        # Base logging configuration (console + queue), wired imperatively —
+        # avoids the reflection and ext:// resolution cost of dictConfig.
+        # console_enabled None means auto: skip the console handler when
+        # stdout is not a TTY (e.g. piped to a discarded stream).
+        console_enabled = json_config.get("console_enabled", True)
+        if console_enabled is None:
+            console_enabled = bool(sys.stdout and sys.stdout.isatty())
+
+        handlers: list[logging.Handler] = []
+        if console_enabled:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(
+                logging.Formatter(json_config.get("console_format"), datefmt="[%X]")
+            )
+            console_handler.setLevel(logging.DEBUG)
+            handlers.append(console_handler)
+
+        queue_handler = BoundedQueueHandler(
+            _log_queue, policy=json_config.get("queue_full_policy", "drop")
+        )
+        queue_handler.setLevel(logging.DEBUG)
+        handlers.append(queue_handler)
+
         _logger = logging.getLogger(_LOGGER_NAME)
-        _logger.info("Logging configured: console + JSON via QueueListener")
+        _logger.handlers = list(handlers)
+        _logger.setLevel(logging.DEBUG)
+        _logger.propagate = False
+        _install_fast_level_check(_logger)
+
+        root_logger = logging.getLogger()
+        root_logger.handlers = list(handlers)
+        root_logger.setLevel(logging.DEBUG)
+
+        configured_level = json_config.get("level", "DEBUG")
+        if isinstance(configured_level, str):
+            configured_level = logging.getLevelName(configured_level.upper())
+        DEBUG_ENABLED = (
+            isinstance(configured_level, int) and configured_level <= logging.DEBUG
+        )
+        _logger.info("Logging configured: console + JSON via BatchingListener")
         _logger.info("Log file: %s", file_handler.baseFilename)
 
         return _logger
@@ -110,33 +444,19 @@ def _stop_listener() -> None:
 
     Note
     ----
-    The qsize() method is only an estimate and may not accurately reflect
-    the actual number of pending messages.
+    The stop sentinel is enqueued behind any pending records, so the
+    listener drains everything already queued before its thread exits —
+    no polling needed.
     """
     global _listener, _log_queue
 
     if _listener is None:
         return
 
-    try:
-        pending = _log_queue.qsize() if _log_queue else -1
-    except Exception:
-        pending = -1
-
-    print(f"INFO:pylogcfg:Listener stopping ({pending} pending messages)...")
-
-    # Wait until the queue is empty or until a timeout (2 seconds)
-    timeout = time.monotonic() + 2.0
-    while time.monotonic() < timeout:
-        try:
-            if not _log_queue or _log_queue.qsize() == 0:
-                break
-        except Exception:
-            break
-        time.sleep(0.05)
+    print("INFO:pylogcfg:Listener stopping...")
 
     try:
-        _listener.stop()
+        _listener.stop(timeout=2.0)
         print("INFO:pylogcfg:Listener stopped successfully.")
     except Exception as exc:
         print(f"ERROR:pylogcfg:Failed to stop listener: {exc}")
@@ -176,3 +496,22 @@ def get_logger(
     new_logger.setLevel(log_level)
 
     return new_logger
+
+
+def dbg(msg: str, *args: Any) -> None:
+    """
+    Low-overhead DEBUG logging for hot paths.
+
+    Checks the effective level first and calls the logger's internal
+    _log directly, skipping the public Logger.debug wrapper frame.
+    A no-op until the logging system has been initialized.
+
+    Parameters
+    ----------
+    msg : str
+        Message (printf-style) to log at DEBUG level.
+    *args : Any
+        Arguments merged into msg, evaluated only if DEBUG is enabled.
+    """
+    if _logger is not None and _logger.isEnabledFor(logging.DEBUG):
+        _logger._log(logging.DEBUG, msg, args)
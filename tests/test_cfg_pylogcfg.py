@@ -37,6 +37,20 @@ def test_load_configs_creates_default_when_missing(tmp_path: Path, monkeypatch):
     assert tmp_file.exists()
 
 
+def test_load_configs_reuses_cache_until_file_changes(tmp_path: Path, monkeypatch):
+    tmp_file = tmp_path / "pylogconfig.json"
+    monkeypatch.setattr(cfg, "config_file", tmp_file)
+    monkeypatch.setattr(cfg, "_config_cache", None)
+
+    first = cfg.load_configs()
+    assert cfg.load_configs() is first
+
+    # Rewriting the file with a newer mtime invalidates the cache
+    tmp_file.write_text(json.dumps({"app": "other"}), encoding="utf-8")
+    os.utime(tmp_file, (tmp_file.stat().st_atime, tmp_file.stat().st_mtime + 10))
+    assert cfg.load_configs()["app"] == "other"
+
+
 def test_json_formatter_invalid_timezone_fallbacks_to_local(monkeypatch):
     # Use a config with invalid timezone
     bad_cfg = {"timezone": "No/Such_Zone", "date_format": "%Y-%m-%dT%H:%M:%S%z"}
@@ -1,8 +1,11 @@
 import logging
+import logging.handlers
+import queue
 
 import pytest
 
 from pylogcfg import pylogcfg as pcfg
+from pylogcfg.cfg_pylogcfg import JSONLogFormatter
 from pylogcfg.pylogcfg import get_logger
 
 
@@ -21,3 +24,94 @@ def test_get_logger_initialization_fails_raises_runtime(monkeypatch):
     monkeypatch.setattr(pcfg, "initialize_logging", fake_init)
     with pytest.raises(RuntimeError):
         get_logger("something")
+
+
+def test_bounded_queue_handler_drops_when_full(monkeypatch):
+    monkeypatch.setattr(pcfg, "_dropped_records", 0)
+    full_queue = queue.Queue(maxsize=1)
+    full_queue.put(object())
+    handler = pcfg.BoundedQueueHandler(full_queue, policy="drop")
+    record = logging.LogRecord("t", logging.INFO, "", 0, "msg", (), None)
+    # Should not raise even though the queue is full
+    handler.enqueue(record)
+    assert pcfg._dropped_records == 1
+
+
+def test_batching_listener_keeps_batch_on_poison_record(tmp_path, monkeypatch):
+    # A record whose formatting fails must not discard the others
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    log_file = tmp_path / "log.jsonl"
+    handler = pcfg.FastJSONLRotatingHandler(log_file)
+    handler.setFormatter(JSONLogFormatter({}))
+
+    log_queue = queue.Queue()
+    listener = pcfg.BatchingListener(log_queue, handler)
+    log_queue.put(logging.LogRecord("t", logging.INFO, "", 0, "good 1", (), None))
+    log_queue.put(logging.LogRecord("t", logging.INFO, "", 0, "bad %d", ("x",), None))
+    log_queue.put(logging.LogRecord("t", logging.INFO, "", 0, "good 2", (), None))
+    listener.start()
+    listener.stop(timeout=2.0)
+    handler.close()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert "good 1" in lines[0]
+    assert "good 2" in lines[1]
+
+
+def test_fast_jsonl_handler_emits_json_lines(tmp_path):
+    log_file = tmp_path / "log.jsonl"
+    handler = pcfg.FastJSONLRotatingHandler(log_file)
+    handler.setFormatter(JSONLogFormatter({}))
+    record = logging.LogRecord("t", logging.INFO, "", 0, "raw fd write", (), None)
+    handler.emit(record)
+    handler.close()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert "raw fd write" in lines[0]
+
+
+def test_batching_listener_writes_all_records(tmp_path):
+    log_file = tmp_path / "log.jsonl"
+    handler = logging.handlers.RotatingFileHandler(log_file, delay=True)
+    handler.setFormatter(JSONLogFormatter({}))
+
+    log_queue = queue.Queue()
+    listener = pcfg.BatchingListener(log_queue, handler)
+    listener.start()
+    for i in range(5):
+        record = logging.LogRecord("t", logging.INFO, "", 0, f"msg {i}", (), None)
+        log_queue.put(record)
+    listener.stop(timeout=2.0)
+    handler.close()
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    assert "msg 0" in lines[0]
+    assert "msg 4" in lines[4]
+
+
+def test_batching_listener_text_fallback_survives_rollover(tmp_path):
+    # Small maxBytes forces the fallback path through doRollover, which
+    # closes the stream on delay=True handlers
+    log_file = tmp_path / "log.jsonl"
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=150, backupCount=3, delay=True
+    )
+    handler.setFormatter(JSONLogFormatter({}))
+
+    log_queue = queue.Queue()
+    listener = pcfg.BatchingListener(log_queue, handler)
+    listener.start()
+    for i in range(6):
+        record = logging.LogRecord("t", logging.INFO, "", 0, f"msg {i}", (), None)
+        log_queue.put(record)
+    listener.stop(timeout=2.0)
+    handler.close()
+
+    content = ""
+    for path in tmp_path.iterdir():
+        content += path.read_text(encoding="utf-8")
+    for i in range(6):
+        assert f"msg {i}" in content